@@ -1,6 +1,7 @@
 """
 Cost Analysis Agent for vendor comparison and optimization
 """
+import os
 import pandas as pd
 import numpy as np
 import logging
@@ -9,6 +10,20 @@ from utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Composite score weights per priority, ordered (cost, service, eco, reliability)
+_PRIORITY_WEIGHTS = {
+    'cost': np.array([0.6, 0.2, 0.1, 0.1]),
+    'speed': np.array([0.2, 0.4, 0.1, 0.3]),
+    'eco': np.array([0.1, 0.2, 0.5, 0.2]),
+    'balanced': np.array([0.3, 0.25, 0.25, 0.2])
+}
+
+# Defaults for optional numeric vendor columns that are missing or unparseable
+_OPTIONAL_NUMERIC_DEFAULTS = {'service_quality': 8.0, 'max_capacity_kg': 5000}
+
+# Distance assumed when a caller passes a non-positive one
+_FALLBACK_DISTANCE_KM = 1000
+
 class CostAnalyzerAgent:
     """Advanced cost analysis with sustainability and reliability metrics"""
     
@@ -20,15 +35,27 @@ class CostAnalyzerAgent:
             vendor_file: Path to vendor CSV file
         """
         self.vendor_file = vendor_file or Config.VENDORS_FILE
-        self.vendors = self._load_or_create_vendor_data()
+        self.reload_vendor_data()
         
         logger.info(f"CostAnalyzerAgent initialized with {len(self.vendors)} vendors")
     
+    def reload_vendor_data(self):
+        """(Re)load vendor data and rebuild the derived per-vendor arrays"""
+        self.vendors = self._load_or_create_vendor_data()
+        
+        # Vendor attributes are static between reloads, so keep them as arrays for per-request math
+        self._cost_per_km = self.vendors['cost_per_km'].to_numpy(dtype=np.float64)
+        self._emission_per_km = self.vendors['emission_per_km'].to_numpy(dtype=np.float64)
+        self._reliability_score = self.vendors['reliability_score'].to_numpy(dtype=np.float64)
+        self._service_quality = self.vendors['service_quality'].to_numpy(dtype=np.float64)
+        self._max_capacity_kg = self.vendors['max_capacity_kg'].to_numpy(dtype=np.float64)
+        self._emission_profile: Optional[Dict[str, Any]] = None
+    
     def _load_or_create_vendor_data(self) -> pd.DataFrame:
         """Load vendor data or create sample data"""
         try:
             # Try to load existing vendor file
-            if self.vendor_file and pd.io.common.file_exists(self.vendor_file):
+            if self.vendor_file and os.path.exists(self.vendor_file):
                 vendors = pd.read_csv(self.vendor_file)
                 logger.info(f"Loaded vendor data from {self.vendor_file}")
                 return self._validate_vendor_data(vendors)
@@ -67,9 +94,10 @@ class CostAnalyzerAgent:
         """Validate and clean vendor data"""
         required_columns = ['vendor', 'cost_per_km', 'emission_per_km', 'reliability_score']
         
-        # Check for required columns
+        # Check for required columns against a column set built once
+        columns = frozenset(vendors.columns)
         for col in required_columns:
-            if col not in vendors.columns:
+            if col not in columns:
                 logger.warning(f"Missing required column: {col}")
                 return self._create_sample_vendor_data()
         
@@ -78,24 +106,33 @@ class CostAnalyzerAgent:
         
         # Ensure numeric columns are numeric
         numeric_columns = ['cost_per_km', 'emission_per_km', 'reliability_score']
-        for col in numeric_columns:
-            vendors[col] = pd.to_numeric(vendors[col], errors='coerce')
+        vendors[numeric_columns] = vendors[numeric_columns].apply(pd.to_numeric, errors='coerce')
         
         # Remove rows with missing critical data
         vendors = vendors.dropna(subset=required_columns)
         
         # Add missing optional columns with defaults
-        if 'delivery_speed' not in vendors.columns:
+        if 'delivery_speed' not in columns:
             vendors['delivery_speed'] = 'Standard'
         
-        if 'service_quality' not in vendors.columns:
-            vendors['service_quality'] = 8.0
-            
-        if 'max_capacity_kg' not in vendors.columns:
-            vendors['max_capacity_kg'] = 5000
+        # Optional numeric columns feed the per-vendor arrays, so coerce them
+        # too and fill blanks or bad values with the defaults
+        for col, default in _OPTIONAL_NUMERIC_DEFAULTS.items():
+            if col not in columns:
+                vendors[col] = default
+            else:
+                vendors[col] = pd.to_numeric(vendors[col], errors='coerce').fillna(default)
         
         return vendors
     
+    @staticmethod
+    def _validate_distance(distance_km: float) -> float:
+        """Return the distance, or the shared fallback distance if it is not positive"""
+        if distance_km <= 0:
+            logger.error(f"Invalid distance provided: {distance_km}, using {_FALLBACK_DISTANCE_KM} km")
+            return _FALLBACK_DISTANCE_KM
+        return distance_km
+    
     def compare_vendors(self, distance_km: float, weight_kg: float = 1000, 
                        priority: str = "balanced") -> Tuple[str, float, pd.DataFrame]:
         """
@@ -110,48 +147,50 @@ class CostAnalyzerAgent:
             Tuple of (best_vendor, best_price, all_vendors_analysis)
         """
         try:
-            if distance_km <= 0:
-                logger.error("Invalid distance provided")
-                distance_km = 1000  # Default fallback
-            
-            # Create analysis dataframe
-            analysis = self.vendors.copy()
+            distance_km = self._validate_distance(distance_km)
             
-            # Calculate costs and metrics
-            analysis['total_cost'] = analysis['cost_per_km'] * distance_km
-            analysis['co2_emission'] = analysis['emission_per_km'] * distance_km
-            analysis['weight_feasible'] = analysis['max_capacity_kg'] >= weight_kg
+            # Calculate costs and metrics on the cached vendor arrays
+            total_cost = self._cost_per_km * distance_km
+            co2_emission = self._emission_per_km * distance_km
+            weight_feasible = self._max_capacity_kg >= weight_kg
             
             # Calculate efficiency scores
-            analysis['cost_efficiency'] = self._calculate_cost_efficiency(analysis['total_cost'])
-            analysis['eco_efficiency'] = self._calculate_eco_efficiency(analysis['co2_emission'])
-            analysis['service_score'] = (analysis['reliability_score'] + analysis['service_quality']) / 2
+            cost_efficiency = self._calculate_cost_efficiency(total_cost)
+            eco_efficiency = self._calculate_eco_efficiency(co2_emission)
+            service_score = (self._reliability_score + self._service_quality) / 2
             
-            # Apply weight constraint
-            feasible_vendors = analysis[analysis['weight_feasible']].copy()
+            # Calculate composite scores based on priority
+            composite_score = self._calculate_composite_score(
+                np.stack([cost_efficiency, service_score, eco_efficiency, self._reliability_score]),
+                priority
+            )
             
-            if feasible_vendors.empty:
+            # Apply weight constraint
+            overweight_surcharge = not weight_feasible.any()
+            if overweight_surcharge:
                 logger.warning(f"No vendors can handle {weight_kg}kg cargo")
                 # Use all vendors but add surcharge for overweight
-                feasible_vendors = analysis.copy()
-                feasible_vendors['total_cost'] *= 1.25  # 25% surcharge
-                feasible_vendors['overweight_surcharge'] = True
+                candidates = np.arange(len(weight_feasible))
+                total_cost = total_cost * 1.25  # 25% surcharge
             else:
-                feasible_vendors['overweight_surcharge'] = False
-            
-            # Calculate composite scores based on priority
-            feasible_vendors['composite_score'] = self._calculate_composite_score(
-                feasible_vendors, priority
+                candidates = np.flatnonzero(weight_feasible)
+            
+            # Sort feasible rows by score once (best first, ties keep vendor order)
+            # and materialize the analysis frame in that order
+            order = candidates[np.argsort(-composite_score[candidates], kind='stable')]
+            feasible_vendors = self.vendors.iloc[order].assign(
+                total_cost=total_cost[order],
+                co2_emission=co2_emission[order],
+                weight_feasible=weight_feasible[order],
+                cost_efficiency=cost_efficiency[order],
+                eco_efficiency=eco_efficiency[order],
+                service_score=service_score[order],
+                overweight_surcharge=overweight_surcharge,
+                composite_score=composite_score[order]
             )
-            
-            # Find best vendor
-            best_idx = feasible_vendors['composite_score'].idxmax()
-            best_vendor = feasible_vendors.loc[best_idx, 'vendor']
-            best_price = feasible_vendors.loc[best_idx, 'total_cost']
-            
-            # Add ranking
             feasible_vendors['rank'] = feasible_vendors['composite_score'].rank(ascending=False)
-            feasible_vendors = feasible_vendors.sort_values('rank')
+            best_vendor = feasible_vendors['vendor'].iat[0]
+            best_price = feasible_vendors['total_cost'].iat[0]
             
             logger.info(f"Best vendor selected: {best_vendor} at ₹{best_price:,.2f}")
             
@@ -161,70 +200,28 @@ class CostAnalyzerAgent:
             logger.error(f"Vendor comparison failed: {e}")
             return self._get_fallback_vendor(distance_km)
     
-    def _calculate_cost_efficiency(self, costs: pd.Series) -> pd.Series:
+    def _calculate_cost_efficiency(self, costs: np.ndarray) -> np.ndarray:
         """Calculate cost efficiency scores (0-10 scale)"""
-        try:
-            min_cost = costs.min()
-            max_cost = costs.max()
-            
-            if max_cost == min_cost:
-                return pd.Series([10.0] * len(costs), index=costs.index)
-            
-            # Invert so lower cost = higher efficiency
-            normalized = (max_cost - costs) / (max_cost - min_cost)
-            return normalized * 10
-            
-        except Exception as e:
-            logger.error(f"Cost efficiency calculation failed: {e}")
-            return pd.Series([7.0] * len(costs), index=costs.index)
+        cost_range = np.ptp(costs)
+        if cost_range == 0:
+            return np.full(len(costs), 10.0)
+        
+        # Invert so lower cost = higher efficiency
+        return (costs.max() - costs) * (10.0 / cost_range)
     
-    def _calculate_eco_efficiency(self, emissions: pd.Series) -> pd.Series:
+    def _calculate_eco_efficiency(self, emissions: np.ndarray) -> np.ndarray:
         """Calculate environmental efficiency scores (0-10 scale)"""
-        try:
-            min_emission = emissions.min()
-            max_emission = emissions.max()
-            
-            if max_emission == min_emission:
-                return pd.Series([10.0] * len(emissions), index=emissions.index)
-            
-            # Invert so lower emission = higher efficiency
-            normalized = (max_emission - emissions) / (max_emission - min_emission)
-            return normalized * 10
-            
-        except Exception as e:
-            logger.error(f"Eco efficiency calculation failed: {e}")
-            return pd.Series([7.0] * len(emissions), index=emissions.index)
+        emission_range = np.ptp(emissions)
+        if emission_range == 0:
+            return np.full(len(emissions), 10.0)
+        
+        # Invert so lower emission = higher efficiency
+        return (emissions.max() - emissions) * (10.0 / emission_range)
     
-    def _calculate_composite_score(self, vendors: pd.DataFrame, priority: str) -> pd.Series:
-        """Calculate composite scores based on optimization priority"""
-        try:
-            # Define weighting schemes
-            weights = {
-                'cost': {'cost': 0.6, 'service': 0.2, 'eco': 0.1, 'reliability': 0.1},
-                'speed': {'service': 0.4, 'reliability': 0.3, 'cost': 0.2, 'eco': 0.1},
-                'eco': {'eco': 0.5, 'service': 0.2, 'reliability': 0.2, 'cost': 0.1},
-                'balanced': {'cost': 0.3, 'service': 0.25, 'eco': 0.25, 'reliability': 0.2}
-            }
-            
-            weight_set = weights.get(priority, weights['balanced'])
-            
-            # Normalize reliability score to 0-10 scale
-            reliability_normalized = vendors['reliability_score']
-            service_normalized = vendors['service_score']
-            
-            # Calculate weighted composite score
-            composite = (
-                weight_set['cost'] * vendors['cost_efficiency'] +
-                weight_set['service'] * service_normalized +
-                weight_set['eco'] * vendors['eco_efficiency'] +
-                weight_set['reliability'] * reliability_normalized
-            )
-            
-            return composite
-            
-        except Exception as e:
-            logger.error(f"Composite score calculation failed: {e}")
-            return pd.Series([7.0] * len(vendors), index=vendors.index)
+    def _calculate_composite_score(self, scores: np.ndarray, priority: str) -> np.ndarray:
+        """Calculate composite scores from (cost, service, eco, reliability) score rows"""
+        weights = _PRIORITY_WEIGHTS.get(priority, _PRIORITY_WEIGHTS['balanced'])
+        return weights @ scores
     
     def _get_fallback_vendor(self, distance_km: float) -> Tuple[str, float, pd.DataFrame]:
         """Provide fallback vendor when analysis fails"""
@@ -251,57 +248,67 @@ class CostAnalyzerAgent:
     def get_sustainability_report(self, distance_km: float) -> Dict[str, Any]:
         """Generate comprehensive sustainability analysis"""
         try:
-            analysis = self.vendors.copy()
-            analysis['total_cost'] = analysis['cost_per_km'] * distance_km
-            analysis['co2_emission'] = analysis['emission_per_km'] * distance_km
-            
-            # Calculate sustainability metrics
-            total_emissions = analysis['co2_emission'].sum()
-            avg_emission = analysis['co2_emission'].mean()
-            best_eco_vendor = analysis.loc[analysis['co2_emission'].idxmin(), 'vendor']
-            worst_eco_vendor = analysis.loc[analysis['co2_emission'].idxmax(), 'vendor']
+            distance_km = self._validate_distance(distance_km)
             
-            # Carbon footprint categories
-            low_carbon = analysis[analysis['emission_per_km'] < 0.4]
-            medium_carbon = analysis[(analysis['emission_per_km'] >= 0.4) & (analysis['emission_per_km'] < 0.7)]
-            high_carbon = analysis[analysis['emission_per_km'] >= 0.7]
+            # Vendor ranking, categories and recommendations don't depend on distance
+            if self._emission_profile is None:
+                self._emission_profile = self._build_emission_profile()
+            profile = self._emission_profile
+            emissions = self._emission_per_km * distance_km
             
             return {
                 'total_route_distance': distance_km,
-                'average_co2_emission': avg_emission,
-                'best_eco_vendor': best_eco_vendor,
-                'worst_eco_vendor': worst_eco_vendor,
-                'low_carbon_options': len(low_carbon),
-                'medium_carbon_options': len(medium_carbon),
-                'high_carbon_options': len(high_carbon),
-                'carbon_savings_potential': analysis['co2_emission'].max() - analysis['co2_emission'].min(),
-                'eco_recommendations': self._get_eco_recommendations(analysis)
+                'average_co2_emission': emissions.mean(),
+                'best_eco_vendor': profile['best_eco_vendor'],
+                'worst_eco_vendor': profile['worst_eco_vendor'],
+                'low_carbon_options': profile['low_carbon_options'],
+                'medium_carbon_options': profile['medium_carbon_options'],
+                'high_carbon_options': profile['high_carbon_options'],
+                'carbon_savings_potential': emissions[profile['worst_pos']] - emissions[profile['best_pos']],
+                'eco_recommendations': list(profile['eco_recommendations'])
             }
             
         except Exception as e:
             logger.error(f"Sustainability report failed: {e}")
             return {'error': str(e)}
     
-    def _get_eco_recommendations(self, analysis: pd.DataFrame) -> list:
+    def _build_emission_profile(self) -> Dict[str, Any]:
+        """Precompute the distance-independent parts of the sustainability report"""
+        emissions = self._emission_per_km
+        vendor_names = self.vendors['vendor'].to_numpy()
+        best_pos, worst_pos = emissions.argmin(), emissions.argmax()
+        mean_emission = emissions.mean()
+        
+        # Carbon footprint categories
+        low_carbon = emissions < 0.4
+        high_carbon = emissions >= 0.7
+        low_carbon_count = int(low_carbon.sum())
+        
+        return {
+            'best_pos': best_pos,
+            'worst_pos': worst_pos,
+            'best_eco_vendor': vendor_names[best_pos],
+            'worst_eco_vendor': vendor_names[worst_pos],
+            'low_carbon_options': low_carbon_count,
+            'medium_carbon_options': int((~low_carbon & ~high_carbon).sum()),
+            'high_carbon_options': int(high_carbon.sum()),
+            'eco_recommendations': self._get_eco_recommendations(
+                vendor_names[best_pos], emissions[best_pos], mean_emission, low_carbon_count
+            )
+        }
+    
+    def _get_eco_recommendations(self, best_eco_vendor: str, best_emission: float,
+                                 mean_emission: float, low_carbon_count: int) -> list:
         """Generate environmental recommendations"""
         recommendations = []
         
-        try:
-            best_eco = analysis.loc[analysis['co2_emission'].idxmin()]
-            avg_emission = analysis['co2_emission'].mean()
-            
-            if best_eco['co2_emission'] < avg_emission * 0.7:
-                recommendations.append(f"Choose {best_eco['vendor']} for 30%+ emission reduction")
-            
-            eco_vendors = analysis[analysis['emission_per_km'] < 0.4]
-            if len(eco_vendors) > 1:
-                recommendations.append(f"{len(eco_vendors)} low-carbon vendors available")
-            
-            if len(recommendations) == 0:
-                recommendations.append("Consider rail or consolidated shipping for better eco-efficiency")
-            
-            return recommendations
-            
-        except Exception as e:
-            logger.error(f"Eco recommendations failed: {e}")
-            return ["Sustainability analysis unavailable"]
\ No newline at end of file
+        if best_emission < mean_emission * 0.7:
+            recommendations.append(f"Choose {best_eco_vendor} for 30%+ emission reduction")
+        
+        if low_carbon_count > 1:
+            recommendations.append(f"{low_carbon_count} low-carbon vendors available")
+        
+        if len(recommendations) == 0:
+            recommendations.append("Consider rail or consolidated shipping for better eco-efficiency")
+        
+        return recommendations
@@ -7,6 +7,7 @@ from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from statsmodels.tsa.seasonal import seasonal_decompose
 import logging
+import time
 import warnings
 from typing import Union, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -63,7 +64,7 @@ class DemandForecastAgent:
             Forecasted demand value
         """
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             logger.info(f"Starting demand forecast for {periods} periods ahead")
             
             # Step 1: Validate and prepare data
@@ -84,7 +85,7 @@ class DemandForecastAgent:
                 self._store_forecast_result(forecast_value, forecast_result['method'], 
                                           forecast_result['confidence'])
                 
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.perf_counter() - start_time
                 logger.info(f"Forecast completed: {forecast_value} ({forecast_result['method']}) "
                           f"in {execution_time:.2f}s")
                 
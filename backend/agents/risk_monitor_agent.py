@@ -3,12 +3,25 @@ Risk Monitoring Agent for weather and operational risk assessment
 """
 import requests
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from bisect import bisect_right
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Coastal cities with more variable weather
+_COASTAL_CITIES = ('mumbai', 'chennai', 'kolkata')
+
+# Weather risk score cut-offs and the (risk_level, impact) for each band
+_RISK_SCORE_THRESHOLDS = (25, 50)
+_RISK_LEVELS = (
+    ("🟢 Low", "Minimal weather-related risks"),
+    ("🟡 Medium", "Moderate risk, monitor conditions closely"),
+    ("🔴 High", "High risk of delays and operational challenges")
+)
+
 class RiskMonitorAgent:
     """Comprehensive risk assessment with weather and operational factors"""
     
@@ -17,11 +30,14 @@ class RiskMonitorAgent:
         self.weather_key = Config.WEATHER_API_KEY
         self.weather_url = Config.WEATHER_API_URL
         
-        # Risk thresholds and categories
+        # Successful API readings keyed by location: (fetched_at, weather_data)
+        self._weather_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # Risk thresholds and categories (keyword tuples matched against lowercase conditions)
         self.weather_risk_categories = {
-            'high_risk': ['storm', 'thunder', 'cyclone', 'snow', 'blizzard', 'tornado', 'hurricane'],
-            'medium_risk': ['rain', 'drizzle', 'fog', 'mist', 'cloudy'],
-            'low_risk': ['clear', 'sunny', 'partly cloudy', 'overcast']
+            'high_risk': ('storm', 'thunder', 'cyclone', 'snow', 'blizzard', 'tornado', 'hurricane'),
+            'medium_risk': ('rain', 'drizzle', 'fog', 'mist', 'cloudy'),
+            'low_risk': ('clear', 'sunny', 'partly cloudy', 'overcast')
         }
         
         self.seasonal_factors = {
@@ -67,11 +83,20 @@ class RiskMonitorAgent:
             logger.error(f"Weather risk assessment failed: {e}")
             return self._get_emergency_fallback(location)
     
+    def clear_cache(self):
+        """Drop all cached weather readings"""
+        self._weather_cache.clear()
+    
     def _get_weather_api_data(self, location: str) -> Optional[Dict[str, Any]]:
         """Get weather data from API"""
         if not self.weather_key:
             return None
         
+        cache_key = location.lower().strip()
+        cached = self._weather_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < Config.WEATHER_CACHE_TTL_SECONDS:
+            return dict(cached[1])
+        
         try:
             params = {
                 "key": self.weather_key,
@@ -91,7 +116,7 @@ class RiskMonitorAgent:
                 current = data["current"]
                 condition = current["condition"]["text"].lower()
                 
-                return {
+                weather_data = {
                     "condition": current["condition"]["text"],
                     "temp": f"{current['temp_c']}°C",
                     "humidity": f"{current['humidity']}%",
@@ -103,6 +128,8 @@ class RiskMonitorAgent:
                     "temp_raw": current['temp_c'],
                     "humidity_raw": current['humidity']
                 }
+                self._weather_cache[cache_key] = (time.monotonic(), weather_data)
+                return dict(weather_data)
             elif "error" in data:
                 return {"error": f"WeatherAPI error: {data['error']['message']}"}
             else:
@@ -127,10 +154,11 @@ class RiskMonitorAgent:
             risk_factors = []
             
             # Weather condition risk
-            if any(risk_word in condition for risk_word in self.weather_risk_categories['high_risk']):
+            categories = self.weather_risk_categories
+            if any(risk_word in condition for risk_word in categories['high_risk']):
                 risk_score += 30
                 risk_factors.append("Severe weather conditions")
-            elif any(risk_word in condition for risk_word in self.weather_risk_categories['medium_risk']):
+            elif any(risk_word in condition for risk_word in categories['medium_risk']):
                 risk_score += 15
                 risk_factors.append("Moderate weather impact")
             
@@ -165,15 +193,7 @@ class RiskMonitorAgent:
                 risk_factors.append("Winter conditions")
             
             # Determine risk level
-            if risk_score >= 50:
-                risk_level = "🔴 High"
-                impact_description = "High risk of delays and operational challenges"
-            elif risk_score >= 25:
-                risk_level = "🟡 Medium"
-                impact_description = "Moderate risk, monitor conditions closely"
-            else:
-                risk_level = "🟢 Low"
-                impact_description = "Minimal weather-related risks"
+            risk_level, impact_description = _RISK_LEVELS[bisect_right(_RISK_SCORE_THRESHOLDS, risk_score)]
             
             return {
                 'risk_level': risk_level,
@@ -196,8 +216,9 @@ class RiskMonitorAgent:
     def _get_intelligent_weather_fallback(self, location: str, error_data: Optional[Dict]) -> Dict[str, Any]:
         """Intelligent fallback based on location and seasonal patterns"""
         try:
-            current_month = datetime.now().month
-            current_hour = datetime.now().hour
+            now = datetime.now()
+            current_month = now.month
+            current_hour = now.hour
             
             # Seasonal risk assessment
             base_risk = 0
@@ -224,7 +245,7 @@ class RiskMonitorAgent:
             
             # Location-specific adjustments
             location_lower = location.lower()
-            if any(coastal in location_lower for coastal in ['mumbai', 'chennai', 'kolkata']):
+            if any(coastal in location_lower for coastal in _COASTAL_CITIES):
                 base_risk += 5
                 risk_factors.append("Coastal location - weather variability")
                 humidity = "70%"
@@ -320,17 +341,19 @@ class RiskMonitorAgent:
                     "Maintain normal delivery schedule"
                 ])
             
-            # Specific factor-based recommendations
-            if any('wind' in factor.lower() for factor in risk_factors):
+            # Specific factor-based recommendations (lowercase all factors once;
+            # newline separators keep keywords from matching across factors)
+            factors_text = '\n'.join(risk_factors).lower()
+            if 'wind' in factors_text:
                 recommendations.append("Secure cargo properly for high winds")
             
-            if any('rain' in factor.lower() or 'monsoon' in factor.lower() for factor in risk_factors):
+            if 'rain' in factors_text or 'monsoon' in factors_text:
                 recommendations.append("Use waterproof packaging and covers")
             
-            if any('fog' in factor.lower() or 'visibility' in factor.lower() for factor in risk_factors):
+            if 'fog' in factors_text or 'visibility' in factors_text:
                 recommendations.append("Allow extra time for reduced visibility conditions")
             
-            if any('temperature' in factor.lower() for factor in risk_factors):
+            if 'temperature' in factors_text:
                 recommendations.append("Consider temperature-sensitive cargo protection")
             
             return recommendations[:5]  # Limit to top 5 recommendations
@@ -348,6 +371,9 @@ class RiskMonitorAgent:
             forecast_days = []
             current_date = datetime.now()
             
+            # Current conditions only adjust today's entry, so fetch them once
+            current_weather = self.check_weather(location)
+            
             for i in range(days):
                 forecast_date = current_date + timedelta(days=i)
                 
@@ -364,8 +390,7 @@ class RiskMonitorAgent:
                 }
                 
                 # Adjust for current conditions if we have them
-                current_weather = self.check_weather(location)
-                if not current_weather.get('error') and i == 0:
+                if i == 0 and not current_weather.get('error'):
                     day_forecast.update({
                         'condition': current_weather.get('condition', 'Unknown'),
                         'risk_level': current_weather.get('risk_level', '🟡 Medium')
@@ -2,15 +2,24 @@
 Route Optimization Agent with Google Maps API integration
 """
 import os
+import re
+import time
 import requests
 import logging
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
 from utils.config import Config
 from utils.vector_db import get_route_intelligence, update_route_data, record_route_performance
 
 logger = logging.getLogger(__name__)
 
+# Hour/minute components of Google Maps duration text, e.g. "5 hours 30 mins"
+_DURATION_HOURS_RE = re.compile(r'(\d+)\s*hour', re.IGNORECASE)
+_DURATION_MINUTES_RE = re.compile(r'(\d+)\s*min', re.IGNORECASE)
+
 class RouteOptimizerAgent:
     """Google Maps API-based route optimization with intelligent fallbacks"""
     
@@ -18,9 +27,16 @@ class RouteOptimizerAgent:
         """Initialize route optimizer with API configuration"""
         self.api_key = Config.GOOGLE_MAPS_API_KEY
         self.api_url = Config.GOOGLE_MAPS_API_URL
-        self.distance_matrix = Config.DISTANCE_MATRIX
+        self.distance_matrix = self._build_symmetric_distance_matrix(Config.DISTANCE_MATRIX)
         self.city_coordinates = Config.CITY_COORDINATES
         
+        # Reuse pooled keep-alive connections across Maps calls; retries stay with tenacity
+        self.http_session = requests.Session()
+        self.http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+        # Recent Google Maps results, oldest first so expired and overflow entries are trimmed from the front
+        self._route_cache: 'OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._route_cache_lock = threading.Lock()
+        
         # Validate API key
         if not self.api_key:
             logger.warning("Google Maps API key not found - using fallback mode")
@@ -44,8 +60,13 @@ class RouteOptimizerAgent:
             # Get historical intelligence from vector database
             route_intelligence = get_route_intelligence(origin, destination)
             
-            # Try to get real-time route from Google Maps API
-            real_time_route = self._get_google_maps_route(origin, destination)
+            # Try to get real-time route from Google Maps API; without a key there
+            # is nothing to call, so don't enter the retry wrapper at all
+            if self.api_key:
+                real_time_route = self._get_live_route(origin, destination)
+            else:
+                logger.info("No Google Maps API key - skipping API call")
+                real_time_route = None
             
             if real_time_route and real_time_route.get("source") == "Google Maps API":
                 # Successfully got real-time data
@@ -77,13 +98,54 @@ class RouteOptimizerAgent:
             logger.error(f"Route optimization failed: {e}")
             return self._create_emergency_fallback(origin, destination)
     
+    def _get_live_route(self, origin: str, destination: str) -> Optional[Dict[str, Any]]:
+        """Get a Google Maps route, reusing a recent live result for the same city pair"""
+        cache_key = (origin.lower().strip(), destination.lower().strip())
+        cached = self._get_cached_route(cache_key)
+        if cached is not None:
+            # The key ignores case/whitespace; echo the caller's own city names
+            cached["path"] = [origin, destination]
+            return cached
+        
+        route = self._get_google_maps_route(origin, destination)
+        # Only successful lookups are cached, so a failed call is retried next time
+        if route and route.get("source") == "Google Maps API":
+            self._cache_route(cache_key, route)
+            route = dict(route)
+        return route
+    
+    def _get_cached_route(self, cache_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached route, dropping the entry if it has expired"""
+        with self._route_cache_lock:
+            cached = self._route_cache.get(cache_key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= Config.ROUTE_CACHE_TTL_SECONDS:
+                del self._route_cache[cache_key]
+                return None
+            return dict(cached[1])
+    
+    def _cache_route(self, cache_key: Tuple[str, str], route: Dict[str, Any]):
+        """Store a route, trimming expired entries and keeping the cache bounded"""
+        now = time.monotonic()
+        with self._route_cache_lock:
+            self._route_cache.pop(cache_key, None)
+            self._route_cache[cache_key] = (now, route)
+            while self._route_cache:
+                oldest_time = next(iter(self._route_cache.values()))[0]
+                if (now - oldest_time < Config.ROUTE_CACHE_TTL_SECONDS
+                        and len(self._route_cache) <= Config.ROUTE_CACHE_MAX_ENTRIES):
+                    break
+                self._route_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached routes"""
+        with self._route_cache_lock:
+            self._route_cache.clear()
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def _get_google_maps_route(self, origin: str, destination: str) -> Optional[Dict[str, Any]]:
         """Get route from Google Maps API with retry logic"""
-        if not self.api_key:
-            logger.info("No Google Maps API key - skipping API call")
-            return None
-        
         try:
             params = {
                 "origin": origin,
@@ -96,7 +158,7 @@ class RouteOptimizerAgent:
             }
             
             logger.info("Calling Google Maps API...")
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = self.http_session.get(self.api_url, params=params, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Google Maps API HTTP error: {response.status_code}")
@@ -195,12 +257,20 @@ class RouteOptimizerAgent:
             logger.error(f"Intelligent fallback failed: {e}")
             return self._create_emergency_fallback(origin, destination)
     
+    @staticmethod
+    def _build_symmetric_distance_matrix(distance_matrix: Dict[tuple, float]) -> Dict[tuple, float]:
+        """Add the reverse of every city pair so lookups need a single probe"""
+        symmetric = {}
+        for (city_a, city_b), distance in distance_matrix.items():
+            symmetric[(city_a.lower().strip(), city_b.lower().strip())] = distance
+        for (city_a, city_b), distance in list(symmetric.items()):
+            # An explicitly listed direction always wins over a mirrored one
+            symmetric.setdefault((city_b, city_a), distance)
+        return symmetric
+    
     def _get_distance_from_matrix(self, origin: str, destination: str) -> float:
         """Get distance from predefined matrix"""
-        key1 = (origin.lower().strip(), destination.lower().strip())
-        key2 = (destination.lower().strip(), origin.lower().strip())
-        
-        return self.distance_matrix.get(key1, self.distance_matrix.get(key2, 1200))
+        return self.distance_matrix.get((origin.lower().strip(), destination.lower().strip()), 1200)
     
     def _create_emergency_fallback(self, origin: str, destination: str) -> Dict[str, Any]:
         """Create emergency fallback response when everything fails"""
@@ -226,38 +296,16 @@ class RouteOptimizerAgent:
     def _parse_duration_to_hours(self, duration_text: str) -> float:
         """Parse Google Maps duration text to hours"""
         try:
-            duration_lower = duration_text.lower()
-            hours = 0
-            minutes = 0
-            
-            # Extract hours
-            if "hour" in duration_lower:
-                hour_parts = duration_lower.split("hour")[0].strip().split()
-                if hour_parts:
-                    hours = int(hour_parts[-1])
-            
-            # Extract minutes
-            if "min" in duration_lower:
-                min_part = duration_lower.split("min")[0]
-                if "hour" in min_part:
-                    min_part = min_part.split("hour")[1]
-                min_parts = min_part.strip().split()
-                if min_parts:
-                    minutes = int(min_parts[-1])
+            hours_match = _DURATION_HOURS_RE.search(duration_text)
+            minutes_match = _DURATION_MINUTES_RE.search(duration_text)
+            hours = int(hours_match.group(1)) if hours_match else 0
+            minutes = int(minutes_match.group(1)) if minutes_match else 0
             
             return hours + (minutes / 60.0)
             
         except Exception as e:
             logger.error(f"Duration parsing failed: {e}")
-            # Fallback: try to extract first number
-            try:
-                import re
-                numbers = re.findall(r'\d+', duration_text)
-                if numbers:
-                    return float(numbers[0])  # Assume first number is hours
-                return 12.0
-            except:
-                return 12.0
+            return 12.0
     
     def _hours_to_duration_text(self, hours: float) -> str:
         """Convert hours to readable duration text"""
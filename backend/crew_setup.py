@@ -351,11 +351,8 @@ def process_crew_results(crew_result) -> Dict[str, Any]:
             "execution_mode": "Error"
         }
 
-def create_fallback_analysis(forecast: float, vendor: str, cost: float, 
-                           origin: str, destination: str, scenario: str) -> Dict[str, Any]:
-    """Create comprehensive fallback analysis when CrewAI fails"""
-    
-    fallback_recommendation = f"""
+# Strategic recommendation used when CrewAI execution fails
+_FALLBACK_RECOMMENDATION_TMPL = """
 ## 📋 STRATEGIC SUPPLY CHAIN RECOMMENDATION
 
 ### 🎯 EXECUTIVE SUMMARY
@@ -411,7 +408,20 @@ def create_fallback_analysis(forecast: float, vendor: str, cost: float,
 **CONFIDENCE LEVEL:** High (85%) - Comprehensive analysis with robust fallback protocols ensures reliable execution.
 
 *Analysis completed using computational models with strategic framework overlay.*
-    """
+"""
+
+def create_fallback_analysis(forecast: float, vendor: str, cost: float, 
+                           origin: str, destination: str, scenario: str) -> Dict[str, Any]:
+    """Create comprehensive fallback analysis when CrewAI fails"""
+    
+    fallback_recommendation = _FALLBACK_RECOMMENDATION_TMPL.format_map({
+        'scenario': scenario,
+        'origin': origin,
+        'destination': destination,
+        'vendor': vendor,
+        'cost': cost,
+        'forecast': forecast
+    })
     
     return {
         "agent_insights": {
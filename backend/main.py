@@ -3,6 +3,7 @@ FastAPI Backend for AI Multi-Agent Supply Chain Optimizer
 Replaces Streamlit with REST API endpoints
 """
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
@@ -15,11 +16,26 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from orchestrator import Orchestrator
+from utils.config import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scenario and city listings are static, so build the payloads once at import
+SCENARIOS = [
+    {
+        "id": config["id"],
+        "name": name,
+        "config": {key: value for key, value in config.items() if key != "id"}
+    }
+    for name, config in Config.SCENARIO_CONFIG.items()
+]
+CITIES = [
+    {"name": name.title(), "coordinates": coordinates}
+    for name, coordinates in Config.CITY_COORDINATES.items()
+]
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Supply Chain Optimizer API",
@@ -74,6 +90,10 @@ class AnalysisRequest(BaseModel):
         example="🟢 Normal Operations"
     )
     orders_csv: Optional[str] = Field(None, description="Path to orders CSV file")
+    include_vendors: bool = Field(
+        default=True,
+        description="Include the full vendor comparison table in the response"
+    )
 
 class ScenarioConfig(BaseModel):
     """Scenario configuration response"""
@@ -197,19 +217,25 @@ async def run_analysis(request: AnalysisRequest, background_tasks: BackgroundTas
         # Get orchestrator
         orchestrator = get_orchestrator()
 
-        # Run comprehensive analysis
-        results = orchestrator.run_comprehensive_analysis(
+        # Run comprehensive analysis in a worker thread; the agents make
+        # blocking HTTP calls and model fits that would stall the event loop
+        results = await run_in_threadpool(
+            orchestrator.run_comprehensive_analysis,
             orders_csv=request.orders_csv,
             origin=request.origin,
             destination=request.destination,
             scenario=request.scenario
         )
 
-        # Convert vendors DataFrame to list of dicts if present
-        if 'all_vendors' in results and results['all_vendors'] is not None:
+        # Convert vendors DataFrame to list of dicts if present; clients that
+        # don't display the vendor table can skip serializing it entirely
+        vendors = results.get('all_vendors')
+        if not request.include_vendors:
+            results['all_vendors'] = None
+        elif vendors is not None:
             try:
-                if hasattr(results['all_vendors'], 'to_dict'):
-                    results['all_vendors'] = results['all_vendors'].to_dict('records')
+                if hasattr(vendors, 'to_dict'):
+                    results['all_vendors'] = vendors.to_dict('records')
             except Exception as e:
                 logger.warning(f"Failed to convert vendors: {e}")
                 results['all_vendors'] = []
@@ -224,78 +250,12 @@ async def run_analysis(request: AnalysisRequest, background_tasks: BackgroundTas
 @app.get("/api/scenarios", tags=["Configuration"])
 async def get_scenarios():
     """Get available operational scenarios"""
-    try:
-        from utils.config import Config
-
-        scenarios = [
-            {
-                "id": "normal",
-                "name": "🟢 Normal Operations",
-                "config": Config.get_scenario_config("🟢 Normal Operations")
-            },
-            {
-                "id": "peak",
-                "name": "📈 Peak Season Demand (+40%)",
-                "config": Config.get_scenario_config("📈 Peak Season Demand (+40%)")
-            },
-            {
-                "id": "fuel",
-                "name": "💰 Fuel Price Surge (+25%)",
-                "config": Config.get_scenario_config("💰 Fuel Price Surge (+25%)")
-            },
-            {
-                "id": "monsoon",
-                "name": "🌪️ Monsoon Disruption",
-                "config": Config.get_scenario_config("🌪️ Monsoon Disruption")
-            },
-            {
-                "id": "emergency",
-                "name": "⚡ Emergency Supply",
-                "config": Config.get_scenario_config("⚡ Emergency Supply")
-            },
-            {
-                "id": "strike",
-                "name": "🏭 Industrial Strike",
-                "config": Config.get_scenario_config("🏭 Industrial Strike")
-            }
-        ]
-
-        return {"scenarios": scenarios}
-
-    except Exception as e:
-        logger.error(f"Failed to fetch scenarios: {e}")
-        # Return default scenarios as fallback
-        return {
-            "scenarios": [
-                {
-                    "id": "normal",
-                    "name": "🟢 Normal Operations",
-                    "config": {"demand_multiplier": 1.0, "cost_multiplier": 1.0, "risk_level": "Low"}
-                }
-            ]
-        }
+    return {"scenarios": SCENARIOS}
 
 @app.get("/api/cities", tags=["Configuration"])
 async def get_cities():
     """Get available cities for route planning"""
-    cities = [
-        {"name": "Mumbai", "coordinates": [19.0760, 72.8777]},
-        {"name": "Delhi", "coordinates": [28.7041, 77.1025]},
-        {"name": "Bangalore", "coordinates": [12.9716, 77.5946]},
-        {"name": "Chennai", "coordinates": [13.0827, 80.2707]},
-        {"name": "Kolkata", "coordinates": [22.5726, 88.3639]},
-        {"name": "Hyderabad", "coordinates": [17.3850, 78.4867]},
-        {"name": "Pune", "coordinates": [18.5204, 73.8567]},
-        {"name": "Ahmedabad", "coordinates": [23.0225, 72.5714]},
-        {"name": "Jaipur", "coordinates": [26.9124, 75.7873]},
-        {"name": "Lucknow", "coordinates": [26.8467, 80.9462]},
-        {"name": "Kanpur", "coordinates": [26.4499, 80.3319]},
-        {"name": "Nagpur", "coordinates": [21.1458, 79.0882]},
-        {"name": "Indore", "coordinates": [22.7196, 75.8577]},
-        {"name": "Bhopal", "coordinates": [23.2599, 77.4126]}
-    ]
-
-    return {"cities": cities}
+    return {"cities": CITIES}
 
 @app.get("/api/system/status", tags=["System"])
 async def get_system_status():
@@ -309,7 +269,7 @@ async def get_system_status():
             "status": "operational",
             "timestamp": datetime.now().isoformat(),
             "system_health": system_health,
-            "execution_log": orchestrator.execution_log[-10:] if orchestrator.execution_log else [],
+            "execution_log": orchestrator.get_recent_log(10),
             "api_availability": orchestrator.api_availability
         }
     except Exception as e:
@@ -323,12 +283,10 @@ async def get_system_status():
 @app.post("/api/system/reset", tags=["System"])
 async def reset_system():
     """Reset the orchestrator system"""
-    global orchestrator_instance
-
     try:
         logger.info("Resetting orchestrator...")
-        orchestrator_instance = None
-        orchestrator = get_orchestrator()
+        # Clear run state in place; rebuilding would re-initialize every agent
+        get_orchestrator().reset_state()
 
         return {
             "status": "success",
@@ -376,6 +334,13 @@ async def startup_event():
     logger.info("Docs: http://localhost:8000/docs")
     logger.info("=" * 50)
 
+    # Build the shared orchestrator up front so the first analysis request
+    # doesn't pay the agent initialization cost
+    try:
+        get_orchestrator()
+    except HTTPException as e:
+        logger.warning(f"Orchestrator warm-up failed, will retry on first request: {e.detail}")
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
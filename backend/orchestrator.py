@@ -4,7 +4,12 @@ Advanced Multi-Agent Orchestrator for Supply Chain Optimization
 import pandas as pd
 import logging
 import json
+import reprlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Any, Optional, Tuple
 
 import sys
@@ -44,6 +49,82 @@ except ImportError:
         def validate_api_keys():
             return {"openai": False, "google_maps": False, "weather": False, "huggingface": False}
 
+class _SummaryRepr(reprlib.Repr):
+    """Bounded repr for execution log summaries that never renders whole DataFrames"""
+
+    def __init__(self):
+        super().__init__()
+        # Summaries are cut to 100 characters anyway, so no container or
+        # value limit below that may kick in before the cut does
+        self.maxlevel = 100
+        self.maxdict = self.maxlist = self.maxtuple = 100
+        self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = 100
+        self.maxlong = self.maxstring = self.maxother = 100
+
+    def repr_dict(self, x, level):
+        # Keep insertion order like str() does (reprlib sorts the keys)
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append('...')
+        return '{' + ', '.join(pieces) + '}'
+
+    def repr_DataFrame(self, obj, level):
+        return f"DataFrame({obj.shape[0]} rows x {obj.shape[1]} cols)"
+
+
+_summary_repr = _SummaryRepr()
+
+# Per-agent weights for the recommendations confidence score
+_CONFIDENCE_WEIGHTS = {'demand': 0.25, 'route': 0.30, 'cost': 0.25, 'risk': 0.20}
+
+# Fixed seed so sample orders (and the forecasts built on them) are reproducible
+_SAMPLE_ORDERS_SEED = 42
+
+# Strategic summary used when CrewAI reasoning is unavailable
+_FALLBACK_REASONING_TMPL = """
+## 📋 STRATEGIC SUPPLY CHAIN ANALYSIS
+
+### 🎯 EXECUTIVE SUMMARY
+**Operational Context:** {scenario} scenario analysis completed using computational models
+**Route Optimization:** {distance_km} km route with {best_vendor}
+**Investment Required:** ₹{best_price:,.2f}
+**Expected Demand:** {forecast:,.0f} orders
+
+### ✅ STRATEGIC RECOMMENDATIONS
+
+**1. IMMEDIATE EXECUTION**
+- Confirm {best_vendor} booking within 2 hours
+- Implement real-time tracking and monitoring systems
+- Prepare inventory for {forecast:,.0f} order fulfillment
+
+**2. RISK MANAGEMENT**
+- Monitor {risk_level} risk conditions
+- Maintain backup vendor and route alternatives
+- Establish clear communication protocols with all stakeholders
+
+**3. PERFORMANCE OPTIMIZATION**
+- Track delivery performance against ₹{best_price:,.2f} budget
+- Monitor customer satisfaction and service quality metrics
+- Capture data for future route and vendor optimization
+
+### 📊 SUCCESS METRICS
+- On-time delivery rate: >95%
+- Cost variance: ±5% of budget
+- Customer satisfaction: >8.5/10
+- Zero stockout incidents
+
+**CONFIDENCE LEVEL:** High (85%) - Comprehensive computational analysis ensures reliable execution.
+
+*Strategic analysis completed using advanced computational frameworks with scenario modeling.*
+"""
+
 class Orchestrator:
     """
     Advanced Multi-Agent Orchestrator for Supply Chain Optimization
@@ -61,8 +142,13 @@ class Orchestrator:
             self.cost_agent = CostAnalyzerAgent()
             self.risk_agent = RiskMonitorAgent()
             
-            # System tracking
+            # System tracking; agent workers log concurrently, so the log is guarded
             self.execution_log = []
+            self._log_lock = threading.Lock()
+            self._analysis_lock = threading.Lock()
+            self._sample_orders: Optional[pd.DataFrame] = None
+            # Only the most recently loaded orders file: (path, mtime, frame)
+            self._orders_cache: Optional[Tuple[str, float, pd.DataFrame]] = None
             self.agent_performance = {
                 'demand': {'success_rate': 0.95, 'avg_time': 2.3},
                 'route': {'success_rate': 0.88, 'avg_time': 3.1},
@@ -81,6 +167,21 @@ class Orchestrator:
             logger.error(f"Orchestrator initialization failed: {e}")
             raise
 
+    def reset_state(self):
+        """Clear run history, forecast tracking and caches, reload vendor data and re-check API keys"""
+        with self._analysis_lock:
+            with self._log_lock:
+                self.execution_log = []
+            self._sample_orders = None
+            self._orders_cache = None
+            self.demand_agent.reset_performance_tracking()
+            self.cost_agent.reload_vendor_data()
+            self.risk_agent.clear_cache()
+            self.route_agent.clear_cache()
+            self.api_availability = Config.validate_api_keys()
+            logger.info("Orchestrator state reset")
+            logger.info(f"API Status: {self.api_availability}")
+
     def _log_execution_step(self, step: str, status: str, data: Any = None, duration: float = 0):
         """Log execution steps for monitoring and debugging"""
         log_entry = {
@@ -88,21 +189,40 @@ class Orchestrator:
             'step': step,
             'status': status,
             'duration_seconds': duration,
-            'data_summary': str(data)[:100] if data else None
+            'data_summary': self._summarize_data(data)
         }
-        self.execution_log.append(log_entry)
+        with self._log_lock:
+            self.execution_log.append(log_entry)
         logger.info(f"Step: {step} | Status: {status} | Duration: {duration:.2f}s")
 
+    def get_recent_log(self, limit: int = 10) -> list:
+        """Return a snapshot of the most recent execution log entries"""
+        with self._log_lock:
+            return self.execution_log[-limit:]
+
+    @staticmethod
+    def _summarize_data(data: Any) -> Optional[str]:
+        """Summarize step data in at most 100 characters without stringifying it in full"""
+        if data is None:
+            return None
+        if isinstance(data, str):
+            return data[:100] or None
+        if isinstance(data, pd.DataFrame):
+            return _summary_repr.repr(data)
+        if isinstance(data, (dict, list, tuple, set, frozenset)):
+            return _summary_repr.repr(data)[:100] if data else None
+        return str(data)[:100] if data else None
+
     def _execute_with_fallback(self, func, fallback_value, agent_name: str, *args, **kwargs):
         """Execute agent function with comprehensive fallback handling"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self._log_execution_step(f"{agent_name}_execution", "SUCCESS", result, duration)
             return result, True
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.error(f"{agent_name} execution failed: {e}")
             self._log_execution_step(f"{agent_name}_execution", "FAILED", str(e), duration)
             return fallback_value, False
@@ -113,44 +233,54 @@ class Orchestrator:
         """
         Run comprehensive multi-agent analysis with enhanced error handling
         """
-        start_time = datetime.now()
-        logger.info(f"Starting comprehensive analysis: {origin} → {destination}")
+        # Agents keep per-run state (fitted model, last forecast, history) and the
+        # orchestrator is shared across requests, so analyses run one at a time
+        with self._analysis_lock:
+            start_time = time.perf_counter()
+            logger.info(f"Starting comprehensive analysis: {origin} → {destination}")
         
-        try:
-            # Step 1: Load and validate data
-            orders = self._load_and_validate_data(orders_csv)
-            
-            # Step 2: Execute computational agents
-            analysis_results = self._execute_computational_agents(
-                orders, origin, destination, scenario
-            )
+            try:
+                # Step 1: Load and validate data
+                orders = self._load_and_validate_data(orders_csv)
             
-            # Step 3: Execute AI reasoning (CrewAI) if available
-            if execute_crew_analysis:
-                ai_insights = self._execute_ai_reasoning(
-                    analysis_results, origin, destination, scenario
+                # Step 2: Execute computational agents
+                analysis_results = self._execute_computational_agents(
+                    orders, origin, destination, scenario
                 )
-            else:
-                ai_insights = self._create_fallback_ai_insights(analysis_results, scenario)
             
-            # Step 4: Compile comprehensive results
-            execution_time = (datetime.now() - start_time).total_seconds()
-            final_results = self._compile_final_results(
-                analysis_results, ai_insights, execution_time, scenario
-            )
+                # Step 3: Execute AI reasoning (CrewAI) if available
+                if execute_crew_analysis:
+                    ai_insights = self._execute_ai_reasoning(
+                        analysis_results, origin, destination, scenario
+                    )
+                else:
+                    ai_insights = self._create_fallback_ai_insights(analysis_results, scenario)
+            
+                # Step 4: Compile comprehensive results
+                execution_time = time.perf_counter() - start_time
+                final_results = self._compile_final_results(
+                    analysis_results, ai_insights, execution_time, scenario
+                )
             
-            logger.info(f"Comprehensive analysis completed in {execution_time:.2f} seconds")
-            return final_results
+                logger.info(f"Comprehensive analysis completed in {execution_time:.2f} seconds")
+                return final_results
             
-        except Exception as e:
-            logger.error(f"Comprehensive analysis failed: {e}")
-            return self._create_emergency_results(origin, destination, scenario)
+            except Exception as e:
+                logger.error(f"Comprehensive analysis failed: {e}")
+                return self._create_emergency_results(origin, destination, scenario)
 
     def _load_and_validate_data(self, orders_csv: Optional[str]) -> pd.DataFrame:
         """Load and validate order data with robust fallbacks"""
         try:
             if orders_csv and os.path.exists(orders_csv):
-                orders = pd.read_csv(orders_csv)
+                # Reuse the last parsed CSV until another file is requested or it changes on disk
+                mtime = os.path.getmtime(orders_csv)
+                cached = self._orders_cache
+                if cached and cached[0] == orders_csv and cached[1] == mtime:
+                    orders = cached[2].copy()
+                else:
+                    orders = pd.read_csv(orders_csv)
+                    self._orders_cache = (orders_csv, mtime, orders.copy())
                 self._log_execution_step("data_loading", "SUCCESS", f"Orders: {len(orders)} records")
                 
                 # Validate data structure
@@ -170,6 +300,11 @@ class Orchestrator:
 
     def _create_sample_orders(self) -> pd.DataFrame:
         """Create realistic sample orders data"""
+        # Seeded, so the series is identical every time; build it once and
+        # hand out copies so callers can't mutate the cached frame
+        if self._sample_orders is not None:
+            return self._sample_orders.copy()
+        
         try:
             import numpy as np
             
@@ -178,20 +313,22 @@ class Orchestrator:
             
             # Base pattern with seasonal variation
             base_orders = 100
-            seasonal_pattern = [
-                base_orders + 15 * np.sin(2 * np.pi * i / 365) + 
-                10 * np.sin(2 * np.pi * i / 7) +  # Weekly pattern
-                np.random.normal(0, 8)  # Random noise
-                for i in range(len(dates))
-            ]
+            rng = np.random.default_rng(_SAMPLE_ORDERS_SEED)
+            day = np.arange(len(dates))
+            seasonal_pattern = (
+                base_orders + 15 * np.sin(2 * np.pi * day / 365) +
+                10 * np.sin(2 * np.pi * day / 7) +  # Weekly pattern
+                rng.normal(0, 8, size=len(dates))  # Random noise
+            )
             
             # Ensure positive values
-            orders_values = [max(50, int(value)) for value in seasonal_pattern]
+            orders_values = np.maximum(50, seasonal_pattern.astype(int))
             
-            return pd.DataFrame({
+            self._sample_orders = pd.DataFrame({
                 'date': dates,
                 'orders': orders_values
             })
+            return self._sample_orders.copy()
             
         except Exception as e:
             logger.error(f"Sample data creation failed: {e}")
@@ -206,17 +343,72 @@ class Orchestrator:
         """Execute all computational agents with scenario adjustments"""
         results = {}
         scenario_config = Config.get_scenario_config(scenario)
+        demand_multiplier = scenario_config['demand_multiplier']
+        cost_multiplier = scenario_config['cost_multiplier']
         
-        # 1. Demand Forecasting
-        forecast, demand_success = self._execute_with_fallback(
-            self.demand_agent.forecast,
-            float(orders['orders'].mean()),
-            "demand",
-            orders
-        )
+        # Demand, route and risk are independent (and mostly waiting on model
+        # fits or HTTP), so run them concurrently; cost only needs the route
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # 1. Demand Forecasting
+            demand_future = executor.submit(
+                self._execute_with_fallback,
+                self.demand_agent.forecast,
+                float(orders['orders'].mean()),
+                "demand",
+                orders
+            )
+            
+            # 2. Route Optimization
+            route_future = executor.submit(
+                self._execute_with_fallback,
+                self.route_agent.get_best_route,
+                {
+                    "path": [origin, destination],
+                    "distance_km": Config.get_distance(origin, destination),
+                    "duration": "Estimated 12-18 hours",
+                    "source": "Fallback estimation",
+                    "polyline": None,
+                    "route_quality": "Basic estimation"
+                },
+                "route",
+                origin, destination
+            )
+            
+            # 4. Risk Assessment
+            risk_future = executor.submit(
+                self._execute_with_fallback,
+                self.risk_agent.check_weather,
+                {
+                    "condition": "Clear",
+                    "temp": "25°C", 
+                    "humidity": "60%",
+                    "wind": "10 km/h",
+                    "risk_level": "🟢 Low",
+                    "source": "Fallback"
+                },
+                "risk",
+                destination
+            )
+            
+            route_info, route_success = route_future.result()
+            results.update({
+                'route_info': route_info,
+                'route_success': route_success
+            })
+            
+            # 3. Cost Analysis (runs here while demand and risk finish)
+            cost_result, cost_success = self._execute_with_fallback(
+                self._safe_cost_analysis,
+                ("Fallback Vendor", 5000, self._create_fallback_vendors()),
+                "cost",
+                route_info["distance_km"]
+            )
+            
+            forecast, demand_success = demand_future.result()
+            risk, risk_success = risk_future.result()
         
         # Apply scenario multiplier
-        forecast_adjusted = forecast * scenario_config['demand_multiplier']
+        forecast_adjusted = forecast * demand_multiplier
         results.update({
             'forecast': forecast_adjusted,
             'forecast_original': forecast,
@@ -224,40 +416,14 @@ class Orchestrator:
             'orders_data': orders
         })
         
-        # 2. Route Optimization
-        route_info, route_success = self._execute_with_fallback(
-            self.route_agent.get_best_route,
-            {
-                "path": [origin, destination],
-                "distance_km": Config.get_distance(origin, destination),
-                "duration": "Estimated 12-18 hours",
-                "source": "Fallback estimation",
-                "polyline": None,
-                "route_quality": "Basic estimation"
-            },
-            "route",
-            origin, destination
-        )
-        results.update({
-            'route_info': route_info,
-            'route_success': route_success
-        })
-        
-        # 3. Cost Analysis
-        cost_result, cost_success = self._execute_with_fallback(
-            self._safe_cost_analysis,
-            ("Fallback Vendor", 5000, self._create_fallback_vendors()),
-            "cost",
-            route_info["distance_km"]
-        )
-        
         vendor, price, all_vendors = cost_result
         
         # Apply scenario cost multiplier
-        price_adjusted = price * scenario_config['cost_multiplier']
-        if not all_vendors.empty:
-            all_vendors = all_vendors.copy()
-            all_vendors['total_cost'] = all_vendors['total_cost'] * scenario_config['cost_multiplier']
+        price_adjusted = price * cost_multiplier
+        if all_vendors is not None and len(all_vendors):
+            all_vendors = all_vendors.assign(
+                total_cost=all_vendors['total_cost'] * cost_multiplier
+            )
         
         results.update({
             'best_vendor': vendor,
@@ -267,21 +433,6 @@ class Orchestrator:
             'cost_success': cost_success
         })
         
-        # 4. Risk Assessment
-        risk, risk_success = self._execute_with_fallback(
-            self.risk_agent.check_weather,
-            {
-                "condition": "Clear",
-                "temp": "25°C", 
-                "humidity": "60%",
-                "wind": "10 km/h",
-                "risk_level": "🟢 Low",
-                "source": "Fallback"
-            },
-            "risk",
-            destination
-        )
-        
         # Apply scenario risk adjustments
         risk = self._adjust_risk_for_scenario(risk, scenario)
         results.update({
@@ -392,42 +543,14 @@ class Orchestrator:
         """Create fallback AI insights when CrewAI is unavailable"""
         route_info = results.get('route_info', {})
         
-        fallback_reasoning = f"""
-## 📋 STRATEGIC SUPPLY CHAIN ANALYSIS
-
-### 🎯 EXECUTIVE SUMMARY
-**Operational Context:** {scenario} scenario analysis completed using computational models
-**Route Optimization:** {route_info.get('distance_km', 'N/A')} km route with {results.get('best_vendor', 'selected vendor')}
-**Investment Required:** ₹{results.get('best_price', 0):,.2f}
-**Expected Demand:** {results.get('forecast', 0):,.0f} orders
-
-### ✅ STRATEGIC RECOMMENDATIONS
-
-**1. IMMEDIATE EXECUTION**
-- Confirm {results.get('best_vendor', 'selected vendor')} booking within 2 hours
-- Implement real-time tracking and monitoring systems
-- Prepare inventory for {results.get('forecast', 0):,.0f} order fulfillment
-
-**2. RISK MANAGEMENT**
-- Monitor {results.get('risk', {}).get('risk_level', 'medium')} risk conditions
-- Maintain backup vendor and route alternatives
-- Establish clear communication protocols with all stakeholders
-
-**3. PERFORMANCE OPTIMIZATION**
-- Track delivery performance against ₹{results.get('best_price', 0):,.2f} budget
-- Monitor customer satisfaction and service quality metrics
-- Capture data for future route and vendor optimization
-
-### 📊 SUCCESS METRICS
-- On-time delivery rate: >95%
-- Cost variance: ±5% of budget
-- Customer satisfaction: >8.5/10
-- Zero stockout incidents
-
-**CONFIDENCE LEVEL:** High (85%) - Comprehensive computational analysis ensures reliable execution.
-
-*Strategic analysis completed using advanced computational frameworks with scenario modeling.*
-        """
+        fallback_reasoning = _FALLBACK_REASONING_TMPL.format_map({
+            'scenario': scenario,
+            'distance_km': route_info.get('distance_km', 'N/A'),
+            'best_vendor': results.get('best_vendor', 'selected vendor'),
+            'best_price': results.get('best_price', 0),
+            'forecast': results.get('forecast', 0),
+            'risk_level': results.get('risk', {}).get('risk_level', 'medium')
+        })
         
         return {
             "agent_insights": {
@@ -459,7 +582,7 @@ class Orchestrator:
             "best_vendor": analysis_results.get('best_vendor', 'Unknown'),
             "best_price": analysis_results.get('best_price', 0),
             "original_price": analysis_results.get('original_price', 0),
-            "all_vendors": analysis_results.get('all_vendors', pd.DataFrame()),
+            "all_vendors": analysis_results.get('all_vendors'),
             "risk": analysis_results.get('risk', {}),
             
             # AI insights
@@ -471,7 +594,7 @@ class Orchestrator:
                 "total_time_seconds": execution_time,
                 "success_rates": success_rates,
                 "timestamp": datetime.now().isoformat(),
-                "execution_log": self.execution_log[-10:],
+                "execution_log": self.get_recent_log(10),
                 "api_availability": self.api_availability,
                 "ai_execution_mode": ai_insights.get("execution_mode", "Unknown")
             },
@@ -512,11 +635,17 @@ class Orchestrator:
     def _calculate_system_health(self) -> Dict[str, Any]:
         """Calculate overall system health metrics"""
         try:
-            recent_logs = self.execution_log[-20:] if self.execution_log else []
+            recent_logs = self.get_recent_log(20)
             if not recent_logs:
                 return {"overall_health": "🟡 Initializing", "success_rate": "N/A"}
             
-            success_count = sum(1 for log in recent_logs if log['status'] == 'SUCCESS')
+            # Tally successes and durations in a single pass over the window
+            success_count = 0
+            total_duration = 0
+            for log in recent_logs:
+                if log['status'] == 'SUCCESS':
+                    success_count += 1
+                total_duration += log.get('duration_seconds', 0)
             total_count = len(recent_logs)
             success_rate = success_count / total_count if total_count > 0 else 0
             
@@ -527,7 +656,7 @@ class Orchestrator:
                     "🔴 Needs Attention"
                 ),
                 "success_rate": f"{success_rate*100:.1f}%",
-                "avg_response_time": f"{sum(log.get('duration_seconds', 0) for log in recent_logs)/total_count:.2f}s",
+                "avg_response_time": f"{total_duration/total_count:.2f}s",
                 "api_status": self.api_availability
             }
         except Exception as e:
@@ -536,7 +665,7 @@ class Orchestrator:
 
     def _calculate_confidence_score(self, demand: bool, route: bool, cost: bool, risk: bool) -> Dict[str, Any]:
         """Calculate confidence score based on agent success rates"""
-        weights = {'demand': 0.25, 'route': 0.30, 'cost': 0.25, 'risk': 0.20}
+        weights = _CONFIDENCE_WEIGHTS
         
         total_confidence = (
             weights['demand'] * (1.0 if demand else 0.3) +
@@ -0,0 +1,40 @@
+"""
+Tests for CostAnalyzerAgent input handling
+"""
+import logging
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.cost_analyzer_agent import CostAnalyzerAgent
+
+logging.disable(logging.CRITICAL)
+
+
+class TestInvalidDistance(unittest.TestCase):
+    """Vendor comparison and the sustainability report share one invalid-distance policy"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.agent = CostAnalyzerAgent()
+
+    def test_compare_vendors_uses_fallback_distance(self):
+        best_vendor, best_price, vendors = self.agent.compare_vendors(1000)
+        for distance in (0, -250):
+            vendor, price, analysis = self.agent.compare_vendors(distance)
+            self.assertEqual(vendor, best_vendor)
+            self.assertEqual(price, best_price)
+            self.assertEqual(analysis['total_cost'].tolist(), vendors['total_cost'].tolist())
+
+    def test_sustainability_report_uses_fallback_distance(self):
+        expected = self.agent.get_sustainability_report(1000)
+        self.assertNotIn('error', expected)
+        for distance in (0, -250):
+            report = self.agent.get_sustainability_report(distance)
+            self.assertEqual(report, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for the shared Orchestrator under concurrent requests
+"""
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestrator import Orchestrator
+
+logging.disable(logging.CRITICAL)
+
+ORDERS_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "orders.csv")
+
+RUNS = [
+    ("Mumbai", "Delhi", "🟢 Normal Operations"),
+    ("Chennai", "Kolkata", "🌪️ Monsoon Disruption"),
+]
+
+
+def _key_figures(result):
+    return (
+        result["forecast"],
+        result["best_vendor"],
+        result["best_price"],
+        result["route_info"]["distance_km"],
+    )
+
+
+class TestConcurrentAnalysis(unittest.TestCase):
+    """Two analyses on one orchestrator must not interfere with each other"""
+
+    def test_concurrent_runs_match_sequential_runs(self):
+        sequential = Orchestrator()
+        expected = {
+            run: _key_figures(sequential.run_comprehensive_analysis(ORDERS_CSV, *run))
+            for run in RUNS
+        }
+
+        shared = Orchestrator()
+        # Hold each forecast open briefly and track how many run at once
+        forecast = shared.demand_agent.forecast
+        active = {"now": 0, "max": 0}
+        active_lock = threading.Lock()
+
+        def tracked_forecast(*args, **kwargs):
+            with active_lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            try:
+                time.sleep(0.2)
+                return forecast(*args, **kwargs)
+            finally:
+                with active_lock:
+                    active["now"] -= 1
+
+        shared.demand_agent.forecast = tracked_forecast
+
+        with ThreadPoolExecutor(max_workers=len(RUNS)) as executor:
+            futures = {
+                run: executor.submit(shared.run_comprehensive_analysis, ORDERS_CSV, *run)
+                for run in RUNS
+            }
+            results = {run: future.result() for run, future in futures.items()}
+
+        for run, result in results.items():
+            self.assertNotIn("emergency_mode", result["execution_metadata"])
+            self.assertEqual(_key_figures(result), expected[run])
+
+        self.assertEqual(active["max"], 1)
+        # Every step and forecast of both runs was recorded exactly once
+        self.assertEqual(len(shared.get_recent_log(100)), len(sequential.get_recent_log(100)))
+        self.assertEqual(len(shared.demand_agent.forecast_history), len(RUNS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,9 @@
 Configuration management for AI Supply Chain Optimizer
 """
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Sequence
 
 # Load environment variables
 load_dotenv()
@@ -31,40 +32,49 @@ class Config:
     DEFAULT_ARIMA_ORDER = (2, 1, 2)
     DEFAULT_FUEL_EFFICIENCY = 15  # km/liter
     DEFAULT_CO2_EMISSION = 0.21  # kg per km
+    WEATHER_CACHE_TTL_SECONDS = 600  # Reuse live weather readings for 10 minutes
+    ROUTE_CACHE_TTL_SECONDS = 300  # Reuse live Google Maps routes for 5 minutes
+    ROUTE_CACHE_MAX_ENTRIES = 1024
     
-    # Scenario Multipliers
-    SCENARIO_CONFIG = {
-        "🟢 Normal Operations": {
+    # Scenario ids and multipliers; read-only at both levels since every caller shares them
+    SCENARIO_CONFIG = MappingProxyType({
+        "🟢 Normal Operations": MappingProxyType({
+            "id": "normal",
             "demand_multiplier": 1.0,
             "cost_multiplier": 1.0,
             "risk_level": "Low"
-        },
-        "📈 Peak Season Demand (+40%)": {
+        }),
+        "📈 Peak Season Demand (+40%)": MappingProxyType({
+            "id": "peak",
             "demand_multiplier": 1.4,
             "cost_multiplier": 1.1,
             "risk_level": "Medium"
-        },
-        "💰 Fuel Price Surge (+25%)": {
+        }),
+        "💰 Fuel Price Surge (+25%)": MappingProxyType({
+            "id": "fuel",
             "demand_multiplier": 1.0,
             "cost_multiplier": 1.25,
             "risk_level": "Medium"
-        },
-        "🌪️ Monsoon Disruption": {
+        }),
+        "🌪️ Monsoon Disruption": MappingProxyType({
+            "id": "monsoon",
             "demand_multiplier": 0.9,
             "cost_multiplier": 1.15,
             "risk_level": "High"
-        },
-        "⚡ Emergency Supply": {
+        }),
+        "⚡ Emergency Supply": MappingProxyType({
+            "id": "emergency",
             "demand_multiplier": 1.2,
             "cost_multiplier": 1.3,
             "risk_level": "Medium"
-        },
-        "🏭 Industrial Strike": {
+        }),
+        "🏭 Industrial Strike": MappingProxyType({
+            "id": "strike",
             "demand_multiplier": 1.0,
             "cost_multiplier": 1.2,
             "risk_level": "High"
-        }
-    }
+        })
+    })
     
     # City Coordinates for Mapping
     CITY_COORDINATES = {
@@ -83,6 +93,7 @@ class Config:
         'indore': [22.7196, 75.8577],
         'bhopal': [23.2599, 77.4126]
     }
+    DEFAULT_CITY_COORDINATES = (23.5, 77.5)  # Geographic centre of India; shared, so immutable
     
     # Distance Matrix (km) for Indian Cities
     DISTANCE_MATRIX = {
@@ -107,22 +118,25 @@ class Config:
     }
     
     @classmethod
-    def get_scenario_config(cls, scenario: str) -> Dict[str, Any]:
+    def get_scenario_config(cls, scenario: str) -> Mapping[str, Any]:
         """Get configuration for a specific scenario"""
         return cls.SCENARIO_CONFIG.get(scenario, cls.SCENARIO_CONFIG["🟢 Normal Operations"])
     
     @classmethod
-    def get_city_coordinates(cls, city: str) -> list:
+    def get_city_coordinates(cls, city: str) -> Sequence[float]:
         """Get coordinates for a city"""
-        return cls.CITY_COORDINATES.get(city.lower().strip(), [23.5, 77.5])
+        return cls.CITY_COORDINATES.get(city.lower().strip(), cls.DEFAULT_CITY_COORDINATES)
     
     @classmethod
     def get_distance(cls, origin: str, destination: str) -> float:
         """Get distance between two cities"""
-        key1 = (origin.lower().strip(), destination.lower().strip())
-        key2 = (destination.lower().strip(), origin.lower().strip())
+        origin_key = origin.lower().strip()
+        destination_key = destination.lower().strip()
         
-        return cls.DISTANCE_MATRIX.get(key1, cls.DISTANCE_MATRIX.get(key2, 1200))
+        distance = cls.DISTANCE_MATRIX.get((origin_key, destination_key))
+        if distance is None:
+            distance = cls.DISTANCE_MATRIX.get((destination_key, origin_key), 1200)
+        return distance
     
     @classmethod
     def validate_api_keys(cls) -> Dict[str, bool]:
@@ -1,6 +1,6 @@
 "use client"
 
-import { useEffect, useRef, useState } from "react"
+import { memo, useEffect, useMemo, useRef, useState } from "react"
 import { MapContainer, TileLayer, Marker, Popup, Polyline, useMap } from "react-leaflet"
 import L from "leaflet"
 import "leaflet/dist/leaflet.css"
@@ -57,7 +57,8 @@ function MapBounds({ positions }: { positions: [number, number][] }) {
   return null
 }
 
-export function RouteMap({
+// Memoized so parent re-renders with unchanged props don't rebuild the map
+export const RouteMap = memo(function RouteMap({
   origin,
   destination,
   routePath,
@@ -93,6 +94,21 @@ export function RouteMap({
     }
   }, [])
 
+  // Memoize the marker/line positions on the endpoint coordinates so MapBounds
+  // only refits (and Polyline only redraws) when the route actually changes
+  const positions = useMemo(() => {
+    const points: [number, number][] = []
+    if (origin) points.push(origin.coordinates)
+    if (destination) points.push(destination.coordinates)
+    return points
+  }, [origin?.coordinates, destination?.coordinates])
+
+  // Use route path if available, otherwise draw straight line
+  const linePositions = useMemo(
+    () => routePath || (origin && destination ? positions : []),
+    [routePath, positions]
+  )
+
   if (!mounted) {
     return (
       <div className="w-full h-full flex items-center justify-center bg-muted rounded-lg">
@@ -110,18 +126,11 @@ export function RouteMap({
   const defaultCenter: [number, number] = [20.5937, 78.9629]
   const defaultZoom = 5
 
-  // Get positions for bounds
-  const positions: [number, number][] = []
-  if (origin) positions.push(origin.coordinates)
-  if (destination) positions.push(destination.coordinates)
-
-  // Use route path if available, otherwise draw straight line
-  const linePositions = routePath || (origin && destination ? [origin.coordinates, destination.coordinates] : [])
-
-  // Use forceKey if provided, otherwise generate stable key from coordinates
+  // Use forceKey if provided, otherwise a stable key from the endpoints so
+  // re-renders update the existing Leaflet map instead of remounting it
   const mapKey = forceKey
     ? `map-${forceKey}`
-    : `map-${origin?.name || "o"}-${destination?.name || "d"}-${Date.now()}`
+    : `map-${origin?.name || "o"}-${destination?.name || "d"}`
 
   try {
     return (
@@ -134,6 +143,7 @@ export function RouteMap({
           className="z-0"
           scrollWheelZoom={true}
           attributionControl={true}
+          preferCanvas={true}
         >
           <TileLayer
             attribution='&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
@@ -203,4 +213,4 @@ export function RouteMap({
       </div>
     )
   }
-}
\ No newline at end of file
+})
\ No newline at end of file
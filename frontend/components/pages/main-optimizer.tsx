@@ -50,83 +50,9 @@ export function MainOptimizer({ scenarios, cities, onRunAnalysis, loading, analy
 
   useEffect(() => {
     if (analysisData && !loading) {
-      // Progressively show agent completions
-      let currentStep = 0
-      const agents = [
-        {
-          id: "demand",
-          name: "Demand Forecast Agent",
-          icon: TrendingUp,
-          output: {
-            forecast: analysisData.forecast,
-            original: analysisData.forecast_original,
-            scenario: analysisData.scenario_applied,
-          },
-        },
-        {
-          id: "route",
-          name: "Route Optimizer Agent",
-          icon: MapPin,
-          output: {
-            distance: `${analysisData.route_info.distance_km.toFixed(0)} km`,
-            duration: analysisData.route_info.duration,
-            path: analysisData.route_info.path.join(" → "),
-          },
-        },
-        {
-          id: "cost",
-          name: "Cost Analyzer Agent",
-          icon: DollarSign,
-          output: {
-            best_vendor: analysisData.best_vendor,
-            best_price: `₹${(analysisData.best_price / 1000).toFixed(1)}K`,
-            savings: `₹${((analysisData.original_price - analysisData.best_price) / 1000).toFixed(1)}K`,
-          },
-        },
-        {
-          id: "risk",
-          name: "Risk Monitor Agent",
-          icon: AlertTriangle,
-          output: {
-            risk_level: analysisData.risk.risk_level,
-            condition: analysisData.risk.condition,
-            temperature: `${analysisData.risk.temp}°C`,
-          },
-        },
-        {
-          id: "coordinator",
-          name: "Strategic Coordinator",
-          icon: Brain,
-          output: {
-            confidence: analysisData.recommendations_confidence.score,
-            level: analysisData.recommendations_confidence.level,
-          },
-        },
-      ]
-
-      const updateAgent = (index: number) => {
-        if (index < agents.length) {
-          setAgentProgress((prev) =>
-            prev.map((agent, i) => {
-              if (i === index) {
-                return { ...agents[index], status: "completed" as const, duration: Math.random() * 2 + 1 }
-              } else if (i === index + 1) {
-                return { ...prev[i], status: "running" as const }
-              }
-              return agent
-            })
-          )
-
-          setTimeout(() => updateAgent(index + 1), 800)
-        } else {
-          setTimeout(() => {
-            setShowFinalResults(true)
-            setShowResults(true)
-          }, 500)
-        }
-      }
-
-      updateAgent(0)
+      // Results replace the agent progress panel as soon as they arrive
+      setShowFinalResults(true)
+      setShowResults(true)
     }
   }, [analysisData, loading])
 
@@ -1,6 +1,6 @@
 "use client"
 
-import { useState } from "react"
+import { useMemo, useState } from "react"
 import dynamic from "next/dynamic"
 import { Card } from "@/components/ui/card"
 import { Button } from "@/components/ui/button"
@@ -39,6 +39,9 @@ const cityCoordinates: Record<string, [number, number]> = {
   Bhopal: [23.2599, 77.4126],
 }
 
+// Shared formatter; toLocaleString() would construct a new one for every row
+const costFormatter = new Intl.NumberFormat()
+
 const vendors = [
   { id: 1, name: "FastLogistics Inc", cost: "₹45,000", reliability: 98, sustainability: 85, rating: 4.8 },
   { id: 2, name: "EcoShip Solutions", cost: "₹42,000", reliability: 95, sustainability: 92, rating: 4.6 },
@@ -48,10 +51,9 @@ const vendors = [
 
 export function VendorRoutes({ analysisData }: VendorRoutesProps) {
   const [viewMode, setViewMode] = useState<"table" | "map">("table")
-  const [mapKey, setMapKey] = useState(0)
   const [isMapLoading, setIsMapLoading] = useState(false)
 
-  // Force map remount when switching to map view
+  // The map is unmounted in table view, so switching back always mounts a fresh one
   const handleViewChange = (mode: "table" | "map") => {
     if (mode === "map") {
       // Show loading state first
@@ -59,7 +61,6 @@ export function VendorRoutes({ analysisData }: VendorRoutesProps) {
       setViewMode(mode)
       // Delay map render to ensure clean state
       setTimeout(() => {
-        setMapKey(Date.now())
         setIsMapLoading(false)
       }, 300)
     } else {
@@ -68,8 +69,9 @@ export function VendorRoutes({ analysisData }: VendorRoutesProps) {
     }
   }
 
-  // Extract route information from analysisData
-  const getRouteInfo = () => {
+  // Extract route information from analysisData; memoized so the map only
+  // sees new origin/destination objects when the analysis itself changes
+  const routeInfo = useMemo(() => {
     if (!analysisData || !analysisData.route_info) {
       return { origin: null, destination: null, distance: null, duration: null }
     }
@@ -99,9 +101,7 @@ export function VendorRoutes({ analysisData }: VendorRoutesProps) {
       distance: analysisData.route_info.distance_km,
       duration: analysisData.route_info.duration,
     }
-  }
-
-  const routeInfo = getRouteInfo()
+  }, [analysisData])
 
   // Use real vendor data from API if available, fallback to mock data
   const displayVendors = (analysisData?.all_vendors && analysisData.all_vendors.length > 0)
@@ -154,7 +154,7 @@ export function VendorRoutes({ analysisData }: VendorRoutesProps) {
                     {typeof vendor.cost === "string"
                       ? vendor.cost
                       : vendor.total_cost
-                      ? `₹${vendor.total_cost.toLocaleString()}`
+                      ? `₹${costFormatter.format(vendor.total_cost)}`
                       : "N/A"}
                   </td>
                   <td className="py-4 px-4">
@@ -206,8 +206,6 @@ export function VendorRoutes({ analysisData }: VendorRoutesProps) {
               </div>
             ) : routeInfo.origin && routeInfo.destination ? (
               <RouteMap
-                key={`route-map-${mapKey}`}
-                forceKey={mapKey}
                 origin={routeInfo.origin}
                 destination={routeInfo.destination}
                 distance={routeInfo.distance || undefined}